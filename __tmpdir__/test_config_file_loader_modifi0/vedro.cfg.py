@@ -0,0 +1,3 @@
+import vedro
+class Config(vedro.Config):
+    pass
\ No newline at end of file
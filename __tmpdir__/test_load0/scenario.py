@@ -0,0 +1,5 @@
+
+import vedro
+class Scenario(vedro.Scenario):
+    def then(self):
+        assert 1 == 2
@@ -0,0 +1,15 @@
+import vedro
+import vedro.plugins.skipper
+import vedro.plugins.tagger
+
+
+class Config(vedro.Config):
+
+    class Plugins(vedro.Config.Plugins):
+
+        class Tagger(vedro.plugins.tagger.Tagger):
+            description = 'desc'
+            enabled = True
+
+        class Skipper(vedro.plugins.skipper.Skipper):
+            enabled = True
@@ -0,0 +1,11 @@
+import vedro.plugins.tagger
+import vedro
+
+
+class Config(vedro.Config):
+    pass
+
+    class Plugins(vedro.Config.Plugins):
+
+        class Tagger(vedro.plugins.tagger.Tagger):
+            enabled = True
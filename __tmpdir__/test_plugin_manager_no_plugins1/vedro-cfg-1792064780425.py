@@ -0,0 +1,11 @@
+import vedro.plugins.tagger
+import vedro
+
+
+class Config(vedro.Config):
+
+    class Plugins(vedro.Config.Plugins):
+        pass
+
+        class Tagger(vedro.plugins.tagger.Tagger):
+            enabled = True
@@ -0,0 +1,14 @@
+import vedro
+import vedro.plugins.skipper
+import vedro.plugins.tagger
+
+
+class Config(vedro.Config):
+
+    class Plugins(vedro.Config.Plugins):
+
+        class Skipper(vedro.plugins.skipper.Skipper):
+            enabled = True
+
+        class Tagger(vedro.plugins.tagger.Tagger):
+            enabled = True
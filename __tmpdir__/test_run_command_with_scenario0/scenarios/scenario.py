@@ -0,0 +1,3 @@
+import vedro
+class Scenario(vedro.Scenario):
+   pass
\ No newline at end of file
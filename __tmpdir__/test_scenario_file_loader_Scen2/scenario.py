@@ -0,0 +1,4 @@
+
+import vedro
+class Scenario_1_VedroScenario(vedro.Scenario):
+    pass
@@ -0,0 +1,4 @@
+
+import vedro
+class TmpScenario(vedro.Scenario):
+    pass
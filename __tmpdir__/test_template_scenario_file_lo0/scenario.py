@@ -0,0 +1,7 @@
+
+import vedro
+class Scenario(vedro.Scenario):
+    @vedro.params("Bob")
+    @vedro.params("Alice")
+    def __init__(self, user):
+        pass
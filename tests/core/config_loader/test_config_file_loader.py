@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 from baby_steps import given, then, when
@@ -48,3 +49,42 @@ async def test_config_file_loader_not_exist(*, tmp_path: Path):
 
     with then:
         assert res == config
+
+
+async def test_config_file_loader_cached(*, tmp_path: Path):
+    with given:
+        loader = ConfigFileLoader(Config)
+        path = tmp_path / "vedro.cfg.py"
+        path.write_text("\n".join([
+            "import vedro",
+            "class Config(vedro.Config):",
+            "    pass",
+        ]))
+        config = await loader.load(path)
+
+    with when:
+        res = await loader.load(path)
+
+    with then:
+        assert res is config
+
+
+async def test_config_file_loader_modified(*, tmp_path: Path):
+    with given:
+        loader = ConfigFileLoader(Config)
+        path = tmp_path / "vedro.cfg.py"
+        path.write_text("\n".join([
+            "import vedro",
+            "class Config(vedro.Config):",
+            "    pass",
+        ]))
+        config = await loader.load(path)
+
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    with when:
+        res = await loader.load(path)
+
+    with then:
+        assert res is not config
@@ -5,9 +5,11 @@ from vedro.core import VirtualScenario
 
 __all__ = ("make_vscenario",)
 
+_CWD = Path.cwd()
+
 
 def make_vscenario(path: str) -> VirtualScenario:
     class _Scenario(Scenario):
-        __file__ = Path(path).absolute()
+        __file__ = _CWD / path
 
     return VirtualScenario(_Scenario, steps=[])
@@ -87,6 +87,25 @@ async def test_ignore_scenario():
         assert list(scheduler.discovered) == scenarios
 
 
+async def test_ignore_many():
+    with given:
+        scenarios = [make_vscenario(), make_vscenario(), make_vscenario()]
+        scheduler = MonotonicScenarioScheduler(scenarios)
+        scheduler.schedule(scenarios[0])
+
+        scheduler.ignore_many([scenarios[0], scenarios[2], make_vscenario()])
+
+    with when:
+        result = []
+        async for scenario in scheduler:
+            result.append(scenario)
+
+    with then:
+        assert result == [scenarios[1]]
+        assert list(scheduler.scheduled) == [scenarios[1]]
+        assert list(scheduler.discovered) == scenarios
+
+
 async def test_ignore_repeated_scenario():
     with given:
         scenarios = [make_vscenario(), make_vscenario()]
@@ -1,5 +1,6 @@
 from types import GeneratorType
 from typing import Callable, Iterator, List
+from unittest.mock import Mock, call
 
 import pytest
 from baby_steps import given, then, when
@@ -68,3 +69,16 @@ def test_get_scheduled(get_scenarios: Callable[[], List[VirtualScenario]]):
     with then:
         assert isinstance(result, GeneratorType)
         assert list(result) == scenarios
+
+
+def test_ignore_many():
+    with given:
+        scenarios = [make_vscenario(), make_vscenario()]
+        scheduler = _ScenarioScheduler(scenarios)
+        scheduler.ignore = Mock()
+
+    with when:
+        scheduler.ignore_many(scenarios)
+
+    with then:
+        assert scheduler.ignore.mock_calls == [call(scenarios[0]), call(scenarios[1])]
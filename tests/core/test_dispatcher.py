@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock, Mock, call
 
 import pytest
 from baby_steps import given, then, when
+from pytest import raises
 
 from vedro.core import Dispatcher, Event, Subscriber
 
@@ -39,6 +40,42 @@ def test_dispatcher_listen(*, dispatcher: Dispatcher, event_type: Type[Event]):
         assert res == dispatcher
 
 
+def test_dispatcher_listen_many(*, dispatcher: Dispatcher, event_type: Type[Event]):
+    with when:
+        res = dispatcher.listen_many([(event_type, lambda e: None)])
+
+    with then:
+        assert res == dispatcher
+
+
+def test_dispatcher_listen_many_not_event(*, dispatcher: Dispatcher):
+    with when, raises(BaseException) as exc_info:
+        dispatcher.listen_many([(object, lambda e: None)])
+
+    with then:
+        assert exc_info.type is AssertionError
+
+
+async def test_dispatcher_listen_many_fire(*, dispatcher: Dispatcher, event_type: Type[Event]):
+    with given:
+        manager_ = Mock()
+        subscribe1_, subscribe2_ = Mock(), Mock()
+        manager_.attach_mock(subscribe1_, "subscribe1_")
+        manager_.attach_mock(subscribe2_, "subscribe2_")
+
+        dispatcher.listen_many([(event_type, subscribe1_), (event_type, subscribe2_)])
+        event = event_type()
+
+    with when:
+        await dispatcher.fire(event)
+
+    with then:
+        assert manager_.mock_calls == [
+            call.subscribe1_(event),
+            call.subscribe2_(event),
+        ]
+
+
 async def test_dispatcher_fire_unknown_event(*, dispatcher: Dispatcher, event_type: Type[Event]):
     with given:
         event = event_type()
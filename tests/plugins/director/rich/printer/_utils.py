@@ -1,6 +1,6 @@
 import sys
 from typing import Any
-from unittest.mock import Mock
+from unittest.mock import MagicMock, Mock
 
 import pytest
 from rich.console import Console, ConsoleDimensions
@@ -11,7 +11,7 @@ from vedro.plugins.director.rich import RichPrinter
 
 @pytest.fixture()
 def console_() -> Mock:
-    return Mock(Console, size=ConsoleDimensions(80, 25))
+    return MagicMock(Console, size=ConsoleDimensions(80, 25))
 
 
 @pytest.fixture()
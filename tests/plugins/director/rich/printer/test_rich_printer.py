@@ -1,3 +1,4 @@
+import sys
 from traceback import format_exception
 from typing import Dict, Union
 from unittest.mock import Mock, call
@@ -5,6 +6,7 @@ from unittest.mock import Mock, call
 import pytest
 from baby_steps import given, then, when
 from rich.style import Style
+from rich.text import Text
 from rich.traceback import Traceback
 
 from vedro.core import ExcInfo, ScenarioStatus, StepStatus
@@ -70,9 +72,10 @@ def test_print_scenario_subject(status: ScenarioStatus, symbol: str, color: str,
         printer.print_scenario_subject(subject, status, prefix=prefix)
 
     with then:
+        line = Text(prefix)
+        line.append(f"{symbol} {subject}", style=Style(color=color))
         assert console_.mock_calls == [
-            call.out(prefix, end=""),
-            call.out(f"{symbol} {subject}", style=Style(color=color)),
+            call.print(line, soft_wrap=True),
         ]
 
 
@@ -95,10 +98,11 @@ def test_print_scenario_subject_elapsed(status: ScenarioStatus, symbol: str, col
         printer.print_scenario_subject(subject, status, elapsed=elapsed)
 
     with then:
+        line = Text()
+        line.append(f"{symbol} {subject}", style=Style(color=color))
+        line.append(f" ({elapsed_repr})", style=Style(color="grey50"))
         assert console_.mock_calls == [
-            call.out("", end=""),
-            call.out(f"{symbol} {subject}", style=Style(color=color), end=""),
-            call.out(f" ({elapsed_repr})", style=Style(color="grey50")),
+            call.print(line, soft_wrap=True),
         ]
 
 
@@ -163,9 +167,10 @@ def test_print_step_name(status: StepStatus, symbol: str, color: str, prefix: st
         printer.print_step_name(name, status, prefix=prefix)
 
     with then:
+        line = Text(prefix)
+        line.append(f"{symbol} {name}", style=Style(color=color))
         assert console_.mock_calls == [
-            call.out(prefix, end=""),
-            call.out(f"{symbol} {name}", style=Style(color=color)),
+            call.print(line, soft_wrap=True),
         ]
 
 
@@ -187,10 +192,11 @@ def test_print_step_name_elapsed(status: StepStatus, symbol: str, color: str,
         printer.print_step_name(name, status, elapsed=elapsed)
 
     with then:
+        line = Text()
+        line.append(f"{symbol} {name}", style=Style(color=color))
+        line.append(f" ({elapsed_repr})", style=Style(color="grey50"))
         assert console_.mock_calls == [
-            call.out("", end=""),
-            call.out(f"{symbol} {name}", style=Style(color=color), end=""),
-            call.out(f" ({elapsed_repr})", style=Style(color="grey50")),
+            call.print(line, soft_wrap=True),
         ]
 
 
@@ -233,6 +239,28 @@ def test_print_pretty_exception(*, printer: RichPrinter, exc_info: ExcInfo, cons
         ]
 
 
+def test_print_pretty_exception_show_locals(*, printer: RichPrinter, console_: Mock):
+    with given:
+        class _Step:
+            def __call__(self):
+                value = "<value>"  # noqa: F841
+                raise KeyError()
+
+        try:
+            _Step()()
+        except KeyError:
+            _, value, traceback = sys.exc_info()
+        exc_info = ExcInfo(type(value), value, traceback)
+
+    with when:
+        printer.print_pretty_exception(exc_info, show_locals=True)
+
+    with then:
+        tb, = console_.mock_calls[0].args
+        frame = tb._args[0].stacks[0].frames[-1]
+        assert list(frame.locals.keys()) == ["value"]
+
+
 def test_print_scope_header(*, printer: RichPrinter, console_: Mock):
     with given:
         title = "<header>"
@@ -321,8 +349,10 @@ def test_print_empty_scope(*, printer: RichPrinter, console_: Mock):
 
     with then:
         assert console_.mock_calls == [
+            call.__enter__(),
             call.out("Scope", style=Style(color="blue", bold=True)),
             call.out(" "),
+            call.__exit__(None, None, None),
         ]
 
 
@@ -338,6 +368,7 @@ def test_print_scope(*, printer: RichPrinter, console_: Mock):
 
     with then:
         assert console_.mock_calls == [
+            call.__enter__(),
             call.out("Scope", style=Style(color="blue", bold=True)),
 
             call.out(" id: ", end="", style=Style(color="blue")),
@@ -347,6 +378,7 @@ def test_print_scope(*, printer: RichPrinter, console_: Mock):
             call.print(TestPretty("Bob")),
 
             call.out(" "),
+            call.__exit__(None, None, None),
         ]
 
 
@@ -363,6 +395,7 @@ def test_print_scope_with_width(*, printer: RichPrinter, console_: Mock):
 
     with then:
         assert console_.mock_calls == [
+            call.__enter__(),
             call.out("Scope", style=Style(color="blue", bold=True)),
 
             call.out(" id: ", end="", style=Style(color="blue")),
@@ -372,6 +405,7 @@ def test_print_scope_with_width(*, printer: RichPrinter, console_: Mock):
             call.print(TestPretty("Bob", overflow="ellipsis", no_wrap=True), width=width),
 
             call.out(" "),
+            call.__exit__(None, None, None),
         ]
 
 
@@ -490,9 +524,11 @@ def test_print_report_stats(stats: Dict[str, int], color: str, *,
         printer.print_report_stats(**stats, elapsed=0.0)
 
     with then:
+        line = Text()
+        line.append(message, style=Style(color=color, bold=True))
+        line.append(" (0.00s)", style=Style(color="blue"))
         assert console_.mock_calls == [
-            call.out(message, style=Style(color=color, bold=True), end=""),
-            call.out(" (0.00s)", style=Style(color="blue")),
+            call.print(line, soft_wrap=True),
         ]
 
 
@@ -511,9 +547,11 @@ def test_print_report_stats_interrupted(printer: RichPrinter, console_: Mock):
         printer.print_report_stats(**stats, is_interrupted=True, elapsed=0.0)
 
     with then:
+        line = Text()
+        line.append(message, style=Style(color="red", bold=True))
+        line.append(" (0.00s)", style=Style(color="blue"))
         assert console_.mock_calls == [
-            call.out(message, style=Style(color="red", bold=True), end=""),
-            call.out(" (0.00s)", style=Style(color="blue")),
+            call.print(line, soft_wrap=True),
         ]
 
 
@@ -1,5 +1,6 @@
 import asyncio
 from argparse import ArgumentParser, Namespace
+from functools import lru_cache
 from pathlib import Path
 from time import monotonic_ns
 from unittest.mock import AsyncMock, Mock
@@ -75,6 +76,11 @@ def make_config() -> ConfigType:
     return TestConfig
 
 
+@lru_cache(typed=True)
+def make_args(repeats: int, repeats_delay: float) -> Namespace:
+    return Namespace(repeats=repeats, repeats_delay=repeats_delay)
+
+
 async def fire_arg_parsed_event(dispatcher: Dispatcher, *,
                                 repeats: int, repeats_delay: float = 0.0) -> None:
     config_loaded_event = ConfigLoadedEvent(Path(), make_config())
@@ -83,7 +89,7 @@ async def fire_arg_parsed_event(dispatcher: Dispatcher, *,
     arg_parse_event = ArgParseEvent(ArgumentParser())
     await dispatcher.fire(arg_parse_event)
 
-    arg_parsed_event = ArgParsedEvent(Namespace(repeats=repeats, repeats_delay=repeats_delay))
+    arg_parsed_event = ArgParsedEvent(make_args(repeats, repeats_delay))
     await dispatcher.fire(arg_parsed_event)
 
 
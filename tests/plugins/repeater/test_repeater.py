@@ -71,7 +71,12 @@ async def test_repeat_passed(repeats: int, *,
         await dispatcher.fire(scenario_passed_event)
 
     with then:
-        assert scheduler_.mock_calls == [call.schedule(scenario_result.scenario)] * (repeats - 1)
+        if repeats > 1:
+            assert scheduler_.mock_calls == [
+                call.schedule_many(scenario_result.scenario, repeats - 1)
+            ]
+        else:
+            assert scheduler_.mock_calls == []
         assert sleep_.mock_calls == []
 
 
@@ -90,7 +95,12 @@ async def test_repeat_failed(repeats: int, *,
         await dispatcher.fire(scenario_failed_event)
 
     with then:
-        assert scheduler_.mock_calls == [call.schedule(scenario_result.scenario)] * (repeats - 1)
+        if repeats > 1:
+            assert scheduler_.mock_calls == [
+                call.schedule_many(scenario_result.scenario, repeats - 1)
+            ]
+        else:
+            assert scheduler_.mock_calls == []
         assert sleep_.mock_calls == []
 
 
@@ -7,7 +7,7 @@ from pytest import raises
 from vedro.core import AggregatedResult, MonotonicScenarioScheduler, ScenarioResult
 from vedro.plugins.repeater import RepeaterScenarioScheduler as Scheduler
 
-from ._utils import make_scenario_result, scheduler
+from ._utils import make_scenario_result, make_vscenario, scheduler
 
 __all__ = ("scheduler",)  # fixtures
 
@@ -74,3 +74,46 @@ def test_aggregate_2failed_1passed(scheduler: Scheduler):
     with then:
         expected = AggregatedResult.from_existing(failed_last, scenario_results)
         assert aggregated_result == expected
+
+
+@pytest.mark.parametrize("count", [1, 2, 3])
+async def test_schedule_many(count: int, *, scheduler: Scheduler):
+    with given:
+        scenario = make_vscenario()
+
+    with when:
+        scheduler.schedule_many(scenario, count)
+
+    with then:
+        assert list(scheduler.scheduled) == [scenario] * count
+        assert [scn async for scn in scheduler] == [scenario] * count
+
+
+async def test_schedule_many_scheduled(scheduler: Scheduler):
+    with given:
+        scenario = make_vscenario()
+        scheduler.schedule(scenario)
+
+    with when:
+        scheduler.schedule_many(scenario, 2)
+
+    with then:
+        assert list(scheduler.scheduled) == [scenario] * 3
+        assert [scn async for scn in scheduler] == [scenario] * 3
+
+
+async def test_schedule_many_while_iterating():
+    with given:
+        scenarios = [make_vscenario(), make_vscenario()]
+        scheduler = Scheduler(scenarios)
+
+    with when:
+        result = []
+        async for scenario in scheduler:
+            if len(result) == 0:
+                scheduler.schedule_many(scenario, 2)
+            result.append(scenario)
+
+    with then:
+        assert result == [scenarios[0]] * 3 + [scenarios[1]]
+        assert list(scheduler.scheduled) == [scenarios[0]] * 3 + [scenarios[1]]
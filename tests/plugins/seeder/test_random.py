@@ -0,0 +1,50 @@
+from typing import List
+
+from baby_steps import given, then, when
+
+from vedro.plugins.seeder import RandomGenerator, StandardRandomGenerator
+
+
+def test_random_ints():
+    with given:
+        generator = StandardRandomGenerator()
+        generator.set_seed("seed")
+        expected = [generator.random_int(1, 100) for _ in range(10)]
+
+        generator.set_seed("seed")
+
+    with when:
+        res = generator.random_ints(1, 100, 10)
+
+    with then:
+        assert res == expected
+
+
+def test_random_ints_zero_count():
+    with given:
+        generator = StandardRandomGenerator()
+
+    with when:
+        res = generator.random_ints(1, 100, 0)
+
+    with then:
+        assert res == []
+
+
+def test_random_ints_default_impl():
+    with given:
+        class _RandomGenerator(StandardRandomGenerator):
+            def random_ints(self, start: int, end: int, count: int) -> List[int]:
+                return RandomGenerator.random_ints(self, start, end, count)
+
+        generator = _RandomGenerator()
+        generator.set_seed("seed")
+        expected = StandardRandomGenerator().random_ints(1, 100, 10)
+
+        generator.set_seed("seed")
+
+    with when:
+        res = generator.random_ints(1, 100, 10)
+
+    with then:
+        assert res == expected
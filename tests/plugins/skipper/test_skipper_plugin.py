@@ -3,6 +3,7 @@ from pathlib import Path
 
 import pytest
 from baby_steps import given, then, when
+from pytest import raises
 
 from vedro.core import Dispatcher
 from vedro.core import MonotonicScenarioScheduler as Scheduler
@@ -93,6 +94,31 @@ async def test_select_multiple_files(*, dispatcher: Dispatcher, tmp_dir: Path):
         assert get_skipped(scheduler.scheduled) == []
 
 
+@pytest.mark.usefixtures(skipper.__name__)
+async def test_select_duplicate_files(*, dispatcher: Dispatcher, tmp_dir: Path):
+    with given:
+        scenarios = [
+            make_vscenario(touch(tmp_dir / "scenarios/dir1/scn1.py")),
+            make_vscenario(touch(tmp_dir / "scenarios/dir1/scn2.py")),
+        ]
+
+        await fire_arg_parsed_event(dispatcher, file_or_dir=[
+            str(scenarios[0].path),
+            str(scenarios[0].path),
+        ], ignore=[
+            str(scenarios[0].path),
+        ])
+
+        scheduler = Scheduler(scenarios)
+        startup_event = StartupEvent(scheduler)
+
+    with when:
+        await dispatcher.fire(startup_event)
+
+    with then:
+        assert list(scheduler.scheduled) == []
+
+
 @pytest.mark.usefixtures(skipper.__name__)
 async def test_select_dir(*, dispatcher: Dispatcher, tmp_dir: Path):
     with given:
@@ -118,6 +144,28 @@ async def test_select_dir(*, dispatcher: Dispatcher, tmp_dir: Path):
         assert get_skipped(scheduler.scheduled) == []
 
 
+@pytest.mark.usefixtures(skipper.__name__)
+async def test_select_dir_with_common_prefix(*, dispatcher: Dispatcher, tmp_dir: Path):
+    with given:
+        scenarios = [
+            make_vscenario(touch(tmp_dir / "scenarios/dir1/scn1.py")),
+            make_vscenario(touch(tmp_dir / "scenarios/dir10/scn1.py")),
+        ]
+
+        await fire_arg_parsed_event(dispatcher, file_or_dir=[
+            str(scenarios[0].path.parent)
+        ])
+
+        scheduler = Scheduler(scenarios)
+        startup_event = StartupEvent(scheduler)
+
+    with when:
+        await dispatcher.fire(startup_event)
+
+    with then:
+        assert list(scheduler.scheduled) == [scenarios[0]]
+
+
 @pytest.mark.usefixtures(skipper.__name__)
 @pytest.mark.parametrize("dirname", ["dir1", "scenarios/dir1"])
 async def test_select_rel_dir(dirname: str, *, dispatcher: Dispatcher, tmp_dir: Path):
@@ -270,3 +318,17 @@ async def test_multiple_skip(*, dispatcher: Dispatcher):
     with then:
         assert list(scheduler.scheduled) == scenarios
         assert get_skipped(scheduler.scheduled) == [scenarios[0], scenarios[3]]
+
+
+@pytest.mark.parametrize("arg", ["file_or_dir", "ignore"])
+@pytest.mark.usefixtures(skipper.__name__)
+async def test_select_nonexistent_path(arg: str, *, dispatcher: Dispatcher, tmp_dir: Path):
+    with given:
+        path = tmp_dir / "scenarios/nonexistent.py"
+
+    with when, raises(BaseException) as exc_info:
+        await fire_arg_parsed_event(dispatcher, **{arg: [str(path)]})
+
+    with then:
+        assert exc_info.type is AssertionError
+        assert str(exc_info.value) == f"{str(path)!r} does not exist"
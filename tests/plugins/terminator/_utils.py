@@ -10,6 +10,8 @@ from vedro import Scenario
 from vedro.core import AggregatedResult, Dispatcher, ExcInfo, ScenarioResult, VirtualScenario
 from vedro.plugins.terminator import Terminator, TerminatorPlugin
 
+_CWD = Path.cwd()
+
 
 @pytest.fixture()
 def dispatcher() -> Dispatcher:
@@ -25,7 +27,7 @@ def terminator(dispatcher: Dispatcher) -> TerminatorPlugin:
 
 def make_vscenario() -> VirtualScenario:
     class _Scenario(Scenario):
-        __file__ = Path(f"scenario_{monotonic_ns()}.py").absolute()
+        __file__ = _CWD / f"scenario_{monotonic_ns()}.py"
 
     return VirtualScenario(_Scenario, steps=[])
 
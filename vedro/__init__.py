@@ -15,7 +15,7 @@ from .plugins.deferrer import defer
 from .plugins.skipper import only, skip, skip_if
 
 __version__ = version
-__all__ = ("Scenario", "Interface", "run", "only", "skip", "skip_if", "params",
+__all__ = ("Scenario", "Interface", "run", "run_async", "only", "skip", "skip_if", "params",
            "context", "defer", "Config", "catched",)
 
 
@@ -24,8 +24,12 @@ def run(*, plugins: Any = None) -> None:
         raise DeprecationWarning("Argument 'plugins' is deprecated, "
                                  "declare plugins in config (vedro.cfg.py)")
 
+    asyncio.run(run_async())
+
+
+async def run_async() -> None:
     cwd = os.getcwd()
     if cwd not in sys.path:
         sys.path.insert(0, cwd)
 
-    asyncio.run(main())
+    await main()
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Optional, cast
+from typing import Dict, Optional, Tuple, cast
 
 from .._module_loader import ModuleFileLoader, ModuleLoader
 from ._config_loader import ConfigLoader
@@ -13,20 +13,32 @@ class ConfigFileLoader(ConfigLoader):
                  module_loader: Optional[ModuleLoader] = None) -> None:
         super().__init__(default_config)
         self._module_loader = module_loader or ModuleFileLoader()
+        self._cache: Dict[Tuple[str, int], ConfigType] = {}
 
     async def load(self, path: Path) -> ConfigType:
-        if not path.exists():
+        try:
+            stat = path.stat()
+        except (FileNotFoundError, NotADirectoryError):
             return self._default_config
+
+        key = (str(path), stat.st_mtime_ns)
+        if key in self._cache:
+            return self._cache[key]
+
+        config = await self._load_config(path)
+        self._cache[key] = config
+        return config
+
+    async def _load_config(self, path: Path) -> ConfigType:
         module = await self._module_loader.load(path)
 
-        config = getattr(module, "Config", None)
+        config = module.__dict__.get("Config")
         if config is None:
             return self._default_config
         assert issubclass(config, Config)
 
         # backward compatibility
-        config.__frozen__ = False
-        config.path = path
-        config.__frozen__ = True
+        # type.__setattr__ bypasses the frozen check of the config metaclass
+        type.__setattr__(config, "path", path)
 
         return cast(ConfigType, config)
@@ -2,7 +2,7 @@ from abc import ABC, abstractmethod
 from asyncio import iscoroutinefunction
 from heapq import heappop, heappush
 from time import monotonic_ns
-from typing import Any, Callable, Dict, List, Type
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Type
 
 from ._event import Event
 
@@ -55,6 +55,15 @@ class Dispatcher:
         heappush(self._events[event.__name__], EventHandler(priority, monotonic_ns(), handler))
         return self
 
+    def listen_many(self, handlers: Iterable[Tuple[Type[Event], HandlerType]],
+                    priority: int = 0) -> "Dispatcher":
+        events = self._events
+        for event, handler in handlers:
+            assert issubclass(event, Event), "Event must be a subclass of 'vedro.events.Event'"
+            registered = events.setdefault(event.__name__, [])
+            heappush(registered, EventHandler(priority, monotonic_ns(), handler))
+        return self
+
     async def fire(self, event: Event) -> None:
         if event.__class__.__name__ not in self._events:
             return
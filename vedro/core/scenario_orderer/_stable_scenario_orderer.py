@@ -1,4 +1,3 @@
-from pathlib import Path
 from typing import Any, List, Tuple
 
 from .._virtual_scenario import VirtualScenario
@@ -9,8 +8,8 @@ __all__ = ("StableScenarioOrderer",)
 
 class StableScenarioOrderer(ScenarioOrderer):
     def _cmp(self, scn: VirtualScenario) -> Tuple[Any, ...]:
-        path = Path(scn.path)
-        return (len(path.parts),) + tuple((len(x), x) for x in path.parts)
+        parts = scn.path.parts
+        return (len(parts),) + tuple((len(x), x) for x in parts)
 
     async def sort(self, scenarios: List[VirtualScenario]) -> List[VirtualScenario]:
-        return list(sorted(scenarios, key=self._cmp))
+        return sorted(scenarios, key=self._cmp)
@@ -1,5 +1,5 @@
 from collections import OrderedDict
-from typing import Iterator, List, Tuple
+from typing import Iterable, Iterator, List, Tuple
 
 from .._virtual_scenario import VirtualScenario
 from ..scenario_result import AggregatedResult, ScenarioResult
@@ -25,6 +25,13 @@ class MonotonicScenarioScheduler(ScenarioScheduler):
         self._scheduled.pop(scenario.unique_id, None)
         self._queue.pop(scenario.unique_id, None)
 
+    def ignore_many(self, scenarios: Iterable[VirtualScenario]) -> None:
+        scheduled_pop, queue_pop = self._scheduled.pop, self._queue.pop
+        for scenario in scenarios:
+            unique_id = scenario.unique_id
+            scheduled_pop(unique_id, None)
+            queue_pop(unique_id, None)
+
     def __aiter__(self) -> "ScenarioScheduler":
         self._queue = self._scheduled.copy()
         return super().__aiter__()
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from collections import OrderedDict
-from typing import Iterator, List
+from typing import Iterable, Iterator, List
 
 from .._virtual_scenario import VirtualScenario
 from ..scenario_result import AggregatedResult, ScenarioResult
@@ -30,6 +30,10 @@ class ScenarioScheduler(ABC):
     def ignore(self, scenario: VirtualScenario) -> None:
         pass
 
+    def ignore_many(self, scenarios: Iterable[VirtualScenario]) -> None:
+        for scenario in scenarios:
+            self.ignore(scenario)
+
     @abstractmethod
     def aggregate_results(self, scenario_results: List[ScenarioResult]) -> AggregatedResult:
         pass
@@ -4,19 +4,49 @@ import warnings
 from os import linesep
 from traceback import format_exception
 from types import FrameType, TracebackType
-from typing import Any, Callable, Dict, List, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union, cast
 
 from rich.console import Console, RenderableType
 from rich.pretty import Pretty
 from rich.status import Status
 from rich.style import Style
-from rich.traceback import Trace, Traceback
+from rich.text import Text
 
 import vedro
 from vedro.core import ExcInfo, ScenarioStatus, StepStatus
 
+if TYPE_CHECKING:  # pragma: no cover
+    from rich.traceback import Trace, Traceback
+
 __all__ = ("RichPrinter",)
 
+_VEDRO_ROOT = os.path.dirname(os.path.abspath(vedro.__file__)) + os.sep
+
+# Types json.dumps can serialize without a custom encoder
+_JSON_TYPES = (dict, list, tuple, str, int, float, type(None))
+
+_BOLD = Style(bold=True)
+_GREEN = Style(color="green")
+_GREEN_BOLD = Style(color="green", bold=True)
+_RED = Style(color="red")
+_RED_BOLD = Style(color="red", bold=True)
+_BLUE = Style(color="blue")
+_BLUE_BOLD = Style(color="blue", bold=True)
+_YELLOW = Style(color="yellow")
+_GREY50 = Style(color="grey50")
+_GREY70 = Style(color="grey70")
+
+_SCENARIO_STATUSES: Dict[ScenarioStatus, Tuple[str, Style]] = {
+    ScenarioStatus.PASSED: ("✔", _GREEN),
+    ScenarioStatus.FAILED: ("✗", _RED),
+    ScenarioStatus.SKIPPED: ("○", _GREY70),
+}
+
+_STEP_STATUSES: Dict[StepStatus, Tuple[str, Style]] = {
+    StepStatus.PASSED: ("✔", _GREEN),
+    StepStatus.FAILED: ("✗", _RED),
+}
+
 
 def make_console() -> Console:
     return Console(highlight=False, force_terminal=True, markup=False, soft_wrap=True)
@@ -24,7 +54,7 @@ def make_console() -> Console:
 
 class RichPrinter:
     def __init__(self, console_factory: Callable[[], Console] = make_console, *,
-                 traceback_factory: Callable[..., Traceback] = Traceback,
+                 traceback_factory: Optional[Callable[..., "Traceback"]] = None,
                  pretty_factory: Callable[..., Pretty] = Pretty) -> None:
         self._console = console_factory()
         self._traceback_factory = traceback_factory
@@ -40,33 +70,25 @@ class RichPrinter:
 
     def print_namespace(self, namespace: str) -> None:
         namespace = namespace.replace("_", " ").replace("/", " / ")
-        self._console.out(f"* {namespace}", style=Style(bold=True))
+        self._console.out(f"* {namespace}", style=_BOLD)
 
     def print_scenario_subject(self, subject: str, status: ScenarioStatus, *,
                                elapsed: Optional[float] = None, prefix: str = "") -> None:
-        if status == ScenarioStatus.PASSED:
-            subject = f"✔ {subject}"
-            style = Style(color="green")
-        elif status == ScenarioStatus.FAILED:
-            subject = f"✗ {subject}"
-            style = Style(color="red")
-        elif status == ScenarioStatus.SKIPPED:
-            subject = f"○ {subject}"
-            style = Style(color="grey70")
-        else:
+        entry = _SCENARIO_STATUSES.get(status)
+        if entry is None:
             return
+        symbol, style = entry
 
-        self._console.out(prefix, end="")
+        line = Text(prefix)
+        line.append(f"{symbol} {subject}", style=style)
         if elapsed is not None:
-            self._console.out(subject, style=style, end="")
-            self._console.out(f" ({self.format_elapsed(elapsed)})", style=Style(color="grey50"))
-        else:
-            self._console.out(subject, style=style)
+            line.append(f" ({self.format_elapsed(elapsed)})", style=_GREY50)
+        self._console.print(line, soft_wrap=True)
 
     def print_scenario_extra_details(self, extras: List[str], *, prefix: str = "") -> None:
         for extra in extras:
             self._console.out(prefix, end="")
-            self._console.out(f"|> {extra}", style=Style(color="grey50"))
+            self._console.out(f"|> {extra}", style=_GREY50)
 
     def print_step_extra_details(self, extras: List[str], *, prefix: str = "") -> None:
         self.print_scenario_extra_details(extras, prefix=prefix)
@@ -77,21 +99,16 @@ class RichPrinter:
 
     def print_step_name(self, name: str, status: StepStatus, *,
                         elapsed: Optional[float] = None, prefix: str = "") -> None:
-        if status == StepStatus.PASSED:
-            name = f"✔ {name}"
-            style = Style(color="green")
-        elif status == StepStatus.FAILED:
-            name = f"✗ {name}"
-            style = Style(color="red")
-        else:
+        entry = _STEP_STATUSES.get(status)
+        if entry is None:
             return
+        symbol, style = entry
 
-        self._console.out(prefix, end="")
+        line = Text(prefix)
+        line.append(f"{symbol} {name}", style=style)
         if elapsed is not None:
-            self._console.out(name, style=style, end="")
-            self._console.out(f" ({self.format_elapsed(elapsed)})", style=Style(color="grey50"))
-        else:
-            self._console.out(name, style=style)
+            line.append(f" ({self.format_elapsed(elapsed)})", style=_GREY50)
+        self._console.print(line, soft_wrap=True)
 
     def __filter_internals(self, traceback: TracebackType) -> TracebackType:
         class _Traceback:
@@ -105,11 +122,11 @@ class RichPrinter:
         tb = _Traceback(traceback.tb_frame, traceback.tb_lasti, traceback.tb_lineno,
                         traceback.tb_next)
 
-        root = os.path.dirname(vedro.__file__)
         while tb.tb_next is not None:
-            filename = os.path.abspath(tb.tb_frame.f_code.co_filename)
-            if os.path.commonpath([root, filename]) != root:
-                break
+            filename = tb.tb_frame.f_code.co_filename
+            if not filename.startswith(_VEDRO_ROOT):
+                if not os.path.abspath(filename).startswith(_VEDRO_ROOT):
+                    break
             tb = tb.tb_next  # type: ignore
 
         return cast(TracebackType, tb)
@@ -122,14 +139,16 @@ class RichPrinter:
             traceback = self.__filter_internals(exc_info.traceback)
 
         formatted = format_exception(exc_info.type, exc_info.value, traceback, limit=max_frames)
-        self._console.out("".join(formatted), style=Style(color="yellow"))
+        self._console.out("".join(formatted), style=_YELLOW)
 
-    def __filter_locals(self, trace: Trace) -> None:
+    def __filter_locals(self, trace: "Trace") -> None:
         for stack in trace.stacks:
             for frame in stack.frames:
-                if frame.locals is not None:
-                    frame.locals = {k: v for k, v in frame.locals.items()
-                                    if k != "self" and k.isidentifier()}
+                if frame.locals is None:
+                    continue
+                hidden = [k for k in frame.locals if k == "self" or not k.isidentifier()]
+                for key in hidden:
+                    del frame.locals[key]
 
     def print_pretty_exception(self, exc_info: ExcInfo, *,
                                max_frames: int = 8,  # min=4 (see rich.traceback.Traceback impl)
@@ -141,13 +160,17 @@ class RichPrinter:
         else:
             traceback = self.__filter_internals(exc_info.traceback)
 
+        # rich.traceback pulls in pygments, so it is imported on first use only
+        from rich.traceback import Traceback
+
         trace = Traceback.extract(exc_info.type, exc_info.value, traceback,
                                   show_locals=show_locals)
 
         if show_locals:
             self.__filter_locals(trace)
 
-        tb = self._traceback_factory(trace, max_frames=max_frames, word_wrap=word_wrap)
+        traceback_factory = self._traceback_factory or Traceback
+        tb = traceback_factory(trace, max_frames=max_frames, word_wrap=word_wrap)
         self._console.print(tb)
         self.print_empty_line()
 
@@ -155,6 +178,8 @@ class RichPrinter:
         warnings.warn("Deprecated: method will be removed in v2.0", DeprecationWarning)
         if hasattr(value, "__rich__") or hasattr(value, "__rich_console__"):
             return value
+        if not isinstance(value, _JSON_TYPES):
+            return repr(value)
         try:
             return json.dumps(value, ensure_ascii=False, indent=4)
         except BaseException:
@@ -176,19 +201,21 @@ class RichPrinter:
                 self._console.print(self._pretty_factory(smth))
 
     def print_scope(self, scope: Dict[str, Any], *, scope_width: int = -1) -> None:
-        self.print_scope_header("Scope")
-        for key, val in scope.items():
-            self.print_scope_key(key, indent=1)
-            self.print_scope_val(val, scope_width=scope_width)
-        self.print_empty_line()
+        # Buffer the whole scope and write it to the terminal in one go
+        with self._console:
+            self.print_scope_header("Scope")
+            for key, val in scope.items():
+                self.print_scope_key(key, indent=1)
+                self.print_scope_val(val, scope_width=scope_width)
+            self.print_empty_line()
 
     def print_scope_header(self, title: str) -> None:
-        self._console.out(title, style=Style(color="blue", bold=True))
+        self._console.out(title, style=_BLUE_BOLD)
 
     def print_scope_key(self, key: str, *, indent: int = 0, line_break: bool = False) -> None:
         prepend = " " * indent
         end = linesep if line_break else ""
-        self._console.out(f"{prepend}{key}: ", end=end, style=Style(color="blue"))
+        self._console.out(f"{prepend}{key}: ", end=end, style=_BLUE)
 
     def print_scope_val(self, val: Any, *, scope_width: int = -1) -> None:
         if scope_width is None:  # pragma: no cover
@@ -205,7 +232,7 @@ class RichPrinter:
             message,
             "!!!" + spaces + "!!!",
         ])
-        self._console.out(multiline_message, style=Style(color="yellow"))
+        self._console.out(multiline_message, style=_YELLOW)
         if show_traceback:
             self.print_exception(exc_info)
 
@@ -213,32 +240,31 @@ class RichPrinter:
         if len(summary) == 0:
             return
         text = "# " + f"{linesep}# ".join(summary)
-        self._console.out(text, style=Style(color="grey70"))
+        self._console.out(text, style=_GREY70)
 
     def format_elapsed(self, elapsed: float) -> str:
-        hours = int(elapsed // 3600)
-        minutes = int((elapsed - hours * 3600) // 60)
-        seconds = elapsed - hours * 3600 - minutes * 60
+        if elapsed < 60:
+            return f"{elapsed:.2f}s"
 
-        formatted = f"{seconds:.2f}s" if elapsed < 60 else f"{int(seconds)}s"
-        if (minutes > 0) or (hours > 0):
-            formatted = f"{minutes}m {formatted}"
+        minutes, seconds = divmod(int(elapsed), 60)
+        hours, minutes = divmod(minutes, 60)
         if hours > 0:
-            formatted = f"{hours}h {formatted}"
-        return formatted
+            return f"{hours}h {minutes}m {seconds}s"
+        return f"{minutes}m {seconds}s"
 
     def print_report_stats(self, *, total: int, passed: int, failed: int, skipped: int,
                            elapsed: float, is_interrupted: bool = False) -> None:
         if is_interrupted or (failed > 0 or passed == 0):
-            style = Style(color="red", bold=True)
+            style = _RED_BOLD
         else:
-            style = Style(color="green", bold=True)
+            style = _GREEN_BOLD
 
         scenarios = "scenario" if (total == 1) else "scenarios"
-        self._console.out(f"# {total} {scenarios}, "
-                          f"{passed} passed, {failed} failed, {skipped} skipped",
-                          style=style, end="")
-        self._console.out(f" ({self.format_elapsed(elapsed)})", style=Style(color="blue"))
+        line = Text()
+        line.append(f"# {total} {scenarios}, "
+                    f"{passed} passed, {failed} failed, {skipped} skipped", style=style)
+        line.append(f" ({self.format_elapsed(elapsed)})", style=_BLUE)
+        self._console.print(line, soft_wrap=True)
 
     def print_empty_line(self) -> None:
         self._console.out(" ")
@@ -1,7 +1,14 @@
 import asyncio
 from typing import Any, Callable, Coroutine, Type, Union
 
-from vedro.core import ConfigType, Dispatcher, Plugin, PluginConfig, ScenarioScheduler
+from vedro.core import (
+    ConfigType,
+    Dispatcher,
+    Plugin,
+    PluginConfig,
+    ScenarioScheduler,
+    VirtualScenario,
+)
 from vedro.events import (
     ArgParsedEvent,
     ArgParseEvent,
@@ -28,17 +35,19 @@ class RepeaterPlugin(Plugin):
         self._repeats: int = 1
         self._repeats_delay: float = 0.0
         self._global_config: Union[ConfigType, None] = None
-        self._scheduler: Union[ScenarioScheduler, None] = None
-        self._repeat_scenario_id: Union[str, None] = None
+        self._scheduler: Union[RepeaterScenarioScheduler, None] = None
+        self._repeat_scenario: Union[VirtualScenario, None] = None
+        self._dispatcher: Union[Dispatcher, None] = None
 
     def subscribe(self, dispatcher: Dispatcher) -> None:
-        dispatcher.listen(ConfigLoadedEvent, self.on_config_loaded) \
-                  .listen(ArgParseEvent, self.on_arg_parse) \
-                  .listen(ArgParsedEvent, self.on_arg_parsed) \
-                  .listen(StartupEvent, self.on_startup) \
-                  .listen(ScenarioPassedEvent, self.on_scenario_end) \
-                  .listen(ScenarioFailedEvent, self.on_scenario_end) \
-                  .listen(CleanupEvent, self.on_cleanup)
+        self._dispatcher = dispatcher
+        dispatcher.listen_many([
+            (ConfigLoadedEvent, self.on_config_loaded),
+            (ArgParseEvent, self.on_arg_parse),
+            (ArgParsedEvent, self.on_arg_parsed),
+            (StartupEvent, self.on_startup),
+            (CleanupEvent, self.on_cleanup),
+        ])
 
     def on_config_loaded(self, event: ConfigLoadedEvent) -> None:
         self._global_config = event.config
@@ -70,23 +79,33 @@ class RepeaterPlugin(Plugin):
         assert self._global_config is not None  # for type checking
         self._global_config.Registry.ScenarioScheduler.register(self._scheduler_factory, self)
 
+        # Scenario end listeners are only needed when scenarios are actually repeated
+        assert self._dispatcher is not None  # for type checking
+        self._dispatcher.listen_many([
+            (ScenarioPassedEvent, self.on_scenario_end),
+            (ScenarioFailedEvent, self.on_scenario_end),
+        ])
+
     def on_startup(self, event: StartupEvent) -> None:
-        self._scheduler = event.scheduler
+        if self._repeats > 1:
+            assert isinstance(event.scheduler, RepeaterScenarioScheduler)  # for type checking
+            self._scheduler = event.scheduler
 
     async def on_scenario_end(self,
                               event: Union[ScenarioPassedEvent, ScenarioFailedEvent]) -> None:
-        if self._repeats <= 1:
-            return
+        assert self._scheduler is not None  # for type checking
 
-        assert isinstance(self._scheduler, RepeaterScenarioScheduler)  # for type checking
+        # Repeats of a scenario are yielded by the scheduler as the same object
+        if self._repeat_scenario is event.scenario_result.scenario:
+            return
 
-        if self._repeat_scenario_id == event.scenario_result.scenario.unique_id:
+        self._repeat_scenario = event.scenario_result.scenario
+        if self._repeats_delay == 0.0:
+            self._scheduler.schedule_many(event.scenario_result.scenario, self._repeats - 1)
             return
 
-        self._repeat_scenario_id = event.scenario_result.scenario.unique_id
         for _ in range(self._repeats - 1):
-            if self._repeats_delay > 0.0:
-                await self._sleep(self._repeats_delay)
+            await self._sleep(self._repeats_delay)
             self._scheduler.schedule(event.scenario_result.scenario)
 
     def on_cleanup(self, event: CleanupEvent) -> None:
@@ -1,11 +1,33 @@
 from typing import List
 
-from vedro.core import AggregatedResult, MonotonicScenarioScheduler, ScenarioResult
+from vedro.core import (
+    AggregatedResult,
+    MonotonicScenarioScheduler,
+    ScenarioResult,
+    VirtualScenario,
+)
 
 __all__ = ("RepeaterScenarioScheduler",)
 
 
 class RepeaterScenarioScheduler(MonotonicScenarioScheduler):
+    def schedule_many(self, scenario: VirtualScenario, count: int) -> None:
+        assert count > 0
+
+        if scenario.unique_id in self._scheduled:
+            scn, repeats = self._scheduled[scenario.unique_id]
+            scheduled = (scn, repeats + count)
+        else:
+            scheduled = (scenario, count - 1)
+        self._scheduled[scenario.unique_id] = scheduled
+
+        if scenario.unique_id in self._queue:
+            scn, repeats = self._queue[scenario.unique_id]
+            queued = (scn, repeats + count)
+        else:
+            queued = (scenario, count - 1)
+        self._queue[scenario.unique_id] = queued
+
     def aggregate_results(self, scenario_results: List[ScenarioResult]) -> AggregatedResult:
         assert len(scenario_results) > 0
 
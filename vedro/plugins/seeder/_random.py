@@ -1,6 +1,6 @@
 import random
 from abc import ABC, abstractmethod
-from typing import Tuple, TypeVar, cast
+from typing import List, Tuple, TypeVar, cast
 
 __all__ = ("StandardRandomGenerator", "RandomGenerator",
            "SeedType", "StateType",)
@@ -18,6 +18,9 @@ class RandomGenerator(ABC):
     def random_int(self, start: int, end: int) -> int:
         pass
 
+    def random_ints(self, start: int, end: int, count: int) -> List[int]:
+        return [self.random_int(start, end) for _ in range(count)]
+
     @abstractmethod
     def get_state(self) -> StateType:
         pass
@@ -34,6 +37,10 @@ class StandardRandomGenerator(RandomGenerator):
     def random_int(self, start: int, end: int) -> int:
         return random.randint(start, end)
 
+    def random_ints(self, start: int, end: int, count: int) -> List[int]:
+        randint = random.randint
+        return [randint(start, end) for _ in range(count)]
+
     def get_state(self) -> StateType:
         return cast(StateType, random.getstate())
 
@@ -65,30 +65,30 @@ class SeederPlugin(Plugin):
         self._discovered_seed = self._generate_seed()
         self._random.set_seed(self._discovered_seed)
 
-        for scenario in event.scheduler.discovered:
-            self._scenarios[scenario.unique_id] = self._generate_seed()
+        discovered = [scenario.unique_id for scenario in event.scheduler.discovered]
+        seeds = self._random.random_ints(self.MIN_SEED, self.MAX_SEED, len(discovered))
+        self._scenarios = dict(zip(discovered, seeds))
 
     def on_scenario_run(self, event: ScenarioRunEvent) -> None:
         unique_id = event.scenario_result.scenario.unique_id
-        if unique_id not in self._history:
-            self._history[unique_id] = 0
-        self._history[unique_id] += 1
+        runs = self._history.get(unique_id, 0) + 1
+        self._history[unique_id] = runs
 
-        if unique_id not in self._scenarios:
+        seed = self._scenarios.get(unique_id)
+        if seed is None:
             assert self._scheduled_state is not None
             self._random.set_state(self._scheduled_state)
-            self._scenarios[unique_id] = self._generate_seed()
+            seed = self._scenarios[unique_id] = self._generate_seed()
             self._scheduled_state = self._random.get_state()
 
-        seed = self._scenarios[unique_id]
         self._random.set_seed(seed)
 
         if self._use_fixed_seed:
             return
 
-        for _ in range(self._history[unique_id]):
-            seed = self._generate_seed()
-        self._random.set_seed(seed)
+        # Seed for the n-th run is the n-th number generated from the scenario seed
+        seeds = self._random.random_ints(self.MIN_SEED, self.MAX_SEED, runs)
+        self._random.set_seed(seeds[-1])
 
     def on_cleanup(self, event: CleanupEvent) -> None:
         if (event.report.passed + event.report.failed) > 0:
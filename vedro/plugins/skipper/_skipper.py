@@ -1,11 +1,19 @@
 import os
-from typing import Any, List, Optional, Type, Union, cast
+import stat
+from typing import Any, Dict, List, Optional, Set, Tuple, Type, Union, cast
 
 from vedro.core import Dispatcher, Plugin, PluginConfig, VirtualScenario
 from vedro.events import ArgParsedEvent, ArgParseEvent, StartupEvent
 
 __all__ = ("Skipper", "SkipperPlugin",)
 
+_MISSING = object()
+_SCENARIOS_DIR = "scenarios"
+_SCENARIOS_PREFIX = _SCENARIOS_DIR + os.sep
+
+# (cls_name, tmpl_idx) filters of all the paths selected for a file or directory
+_PathFilters = Tuple[Tuple[Optional[str], Optional[int]], ...]
+
 
 class _CompositePath:
     def __init__(self, file_path: str, cls_name: Optional[str], tmpl_idx: Optional[int]) -> None:
@@ -20,6 +28,11 @@ class SkipperPlugin(Plugin):
         self._subject: Union[str, None] = None
         self._selected: List[_CompositePath] = []
         self._deselected: List[_CompositePath] = []
+        self._selected_by_path: Dict[str, _PathFilters] = {}
+        self._deselected_by_path: Dict[str, _PathFilters] = {}
+        # Set when everything under a single directory (or file) is selected, e.g. by default
+        self._selected_root: Union[str, None] = None
+        self._selected_root_prefix: Union[str, None] = None
         self._forbid_only = config.forbid_only
 
     def subscribe(self, dispatcher: Dispatcher) -> None:
@@ -37,118 +50,165 @@ class SkipperPlugin(Plugin):
     def on_arg_parsed(self, event: ArgParsedEvent) -> None:
         self._subject = event.args.subject
 
+        # Relative paths are resolved against the current directory, so it is
+        # looked up once and both caches live for this call only
+        cwd = os.getcwd()
+        parsed: Dict[str, _CompositePath] = {}
+        existing: Set[str] = set()
+
         for file_or_dir in event.args.file_or_dir:
-            composite_path = self._get_composite_path(file_or_dir)
-            path = composite_path.file_path
-            assert os.path.isdir(path) or os.path.isfile(path), f"{path!r} does not exist"
+            composite_path = self._parse_path(file_or_dir, cwd, parsed, existing)
             self._selected.append(composite_path)
 
         for file_or_dir in event.args.ignore:
-            composite_path = self._get_composite_path(file_or_dir)
-            path = composite_path.file_path
-            assert os.path.isdir(path) or os.path.isfile(path), f"{path!r} does not exist"
+            composite_path = self._parse_path(file_or_dir, cwd, parsed, existing)
             self._deselected.append(composite_path)
 
-    def _get_composite_path(self, file_or_dir: str) -> _CompositePath:
+        self._selected_by_path = self._index_paths(self._selected)
+        self._deselected_by_path = self._index_paths(self._deselected)
+
+        if len(self._selected_by_path) == 1:
+            [(file_path, filters)] = self._selected_by_path.items()
+            if (None, None) in filters:
+                self._selected_root = file_path
+                self._selected_root_prefix = file_path.rstrip(os.sep) + os.sep
+
+    def _index_paths(self, paths: List[_CompositePath]) -> Dict[str, _PathFilters]:
+        grouped: Dict[str, List[Tuple[Optional[str], Optional[int]]]] = {}
+        for path in paths:
+            grouped.setdefault(path.file_path, []).append((path.cls_name, path.tmpl_idx))
+        return {file_path: tuple(filters) for file_path, filters in grouped.items()}
+
+    def _parse_path(self, file_or_dir: str, cwd: str, parsed: Dict[str, _CompositePath],
+                    existing: Set[str]) -> _CompositePath:
+        composite_path = parsed.get(file_or_dir)
+        if composite_path is None:
+            composite_path = self._get_composite_path(file_or_dir, cwd)
+            self._check_path_exists(composite_path.file_path, existing)
+            parsed[file_or_dir] = composite_path
+        return composite_path
+
+    def _check_path_exists(self, path: str, existing: Set[str]) -> None:
+        if path in existing:
+            return
+        assert self._is_file_or_dir(path), f"{path!r} does not exist"
+        existing.add(path)
+
+    def _is_file_or_dir(self, path: str) -> bool:
+        # One stat call instead of os.path.isdir + os.path.isfile
+        try:
+            mode = os.stat(path).st_mode
+        except (OSError, ValueError):
+            return False
+        return stat.S_ISDIR(mode) or stat.S_ISREG(mode)
+
+    def _get_composite_path(self, file_or_dir: str, cwd: str) -> _CompositePath:
         head, tail = os.path.split(file_or_dir)
-        file_name, *other = tail.split("::")
-        cls_name, *other = "".join(other).split("#")
-        tmpl_idx = "".join(other)
+        file_name, _, rest = tail.partition("::")
+        cls_name, _, tmpl_idx = rest.partition("#")
         return _CompositePath(
-            file_path=self._normalize_path(os.path.join(head, file_name)),
+            file_path=self._normalize_path(os.path.join(head, file_name), cwd),
             cls_name=cls_name if len(cls_name) > 0 else None,
-            tmpl_idx=int(tmpl_idx) if tmpl_idx.isnumeric() else None,
+            tmpl_idx=int(tmpl_idx) if (tmpl_idx.isascii() and tmpl_idx.isdigit()) else None,
         )
 
-    def _normalize_path(self, file_or_dir: str) -> str:
+    def _normalize_path(self, file_or_dir: str, cwd: str) -> str:
         path = os.path.normpath(file_or_dir)
         if os.path.isabs(path):
             return path
         # Joining "./scenarios" will be removed in v2
-        if os.path.commonpath(["scenarios", path]) != "scenarios":
-            path = os.path.join("scenarios", path)
-        return os.path.abspath(path)
-
-    def _get_scenario_attr(self, scenario: VirtualScenario, name: str, default_value: Any) -> Any:
-        template = getattr(scenario._orig_scenario, "__vedro__template__", None)
-        if template and hasattr(template, name):
-            return getattr(template, name)
-        return getattr(scenario._orig_scenario, name, default_value)
-
-    def _is_scenario_skipped(self, scenario: VirtualScenario) -> bool:
-        attr_name = "__vedro__skipped__"
-        template = getattr(scenario._orig_scenario, "__vedro__template__", None)
-        if template and hasattr(template, attr_name):
-            return bool(getattr(template, attr_name))
-        return getattr(scenario._orig_scenario, attr_name, False)
-
-    def _is_scenario_special(self, scenario: VirtualScenario) -> bool:
-        attr_name = "__vedro__only__"
-        template = getattr(scenario._orig_scenario, "__vedro__template__", None)
-        if template and hasattr(template, attr_name):
-            return bool(getattr(template, attr_name))
-        return getattr(scenario._orig_scenario, attr_name, False)
-
-    def _is_match_scenario(self, path: _CompositePath, scenario: VirtualScenario) -> bool:
-        if os.path.commonpath([path.file_path, scenario.path]) != path.file_path:
-            return False
-
-        if (path.cls_name is not None) and (path.cls_name != scenario.name):
+        if path != _SCENARIOS_DIR and not path.startswith(_SCENARIOS_PREFIX):
+            path = os.path.join(_SCENARIOS_DIR, path)
+        return os.path.normpath(os.path.join(cwd, path))
+
+    def _resolve_scenario_meta(self,
+                               scenario: VirtualScenario) -> Tuple[bool, bool, Union[str, None]]:
+        orig_scenario = scenario._orig_scenario
+        template = getattr(orig_scenario, "__vedro__template__", None)
+
+        is_skipped = self._get_attr(orig_scenario, template, "__vedro__skipped__", False)
+        is_special = self._get_attr(orig_scenario, template, "__vedro__only__", False)
+        skip_reason = self._get_attr(orig_scenario, template, "__vedro__skip_reason__", None)
+        return bool(is_skipped), bool(is_special), cast(Union[str, None], skip_reason)
+
+    def _get_attr(self, orig_scenario: Any, template: Any, name: str, default_value: Any) -> Any:
+        if template:
+            value = getattr(template, name, _MISSING)
+            if value is not _MISSING:
+                return value
+        return getattr(orig_scenario, name, default_value)
+
+    def _is_match_scenario(self, cls_name: Optional[str], tmpl_idx: Optional[int],
+                           scenario_name: str, scenario_tmpl_idx: Optional[int]) -> bool:
+        if (cls_name is not None) and (cls_name != scenario_name):
             return False
 
-        if (path.tmpl_idx is not None) and (path.tmpl_idx != scenario.template_index):
+        if (tmpl_idx is not None) and (tmpl_idx != scenario_tmpl_idx):
             return False
 
         return True
 
-    def _is_scenario_selected(self, scenario: VirtualScenario) -> bool:
-        for path in self._selected:
-            if self._is_match_scenario(path, scenario):
-                return True
-        return False
-
-    def _is_scenario_deselected(self, scenario: VirtualScenario) -> bool:
-        for path in self._deselected:
-            if self._is_match_scenario(path, scenario):
-                return True
-        return False
+    def _is_scenario_indexed(self, index: Dict[str, _PathFilters],
+                             scenario: VirtualScenario, scenario_path: str) -> bool:
+        # Only the scenario path and its parent directories can match, so walk up
+        # the tree and look each of them up instead of scanning all the paths.
+        # Every key found this way is the scenario path or one of its parents,
+        # so only the class and template filters are left to check
+        scenario_name, scenario_tmpl_idx = scenario.name, scenario.template_index
+        file_path = scenario_path
+        while True:
+            for cls_name, tmpl_idx in index.get(file_path, ()):
+                if self._is_match_scenario(cls_name, tmpl_idx, scenario_name, scenario_tmpl_idx):
+                    return True
+            parent = os.path.dirname(file_path)
+            if parent == file_path:
+                return False
+            file_path = parent
 
     def _is_scenario_ignored(self, scenario: VirtualScenario) -> bool:
         if self._subject and scenario.subject != self._subject:
             return True
 
-        if not self._is_scenario_selected(scenario):
-            return True
+        # VirtualScenario.path is a Path, convert it once for all the prefix checks
+        scenario_path = str(scenario.path)
 
-        if self._is_scenario_deselected(scenario):
+        if self._selected_root_prefix is not None:
+            if scenario_path != self._selected_root and \
+               not scenario_path.startswith(self._selected_root_prefix):
+                return True
+        elif not self._is_scenario_indexed(self._selected_by_path, scenario, scenario_path):
             return True
 
-        return False
-
-    def _get_skip_reason(self, scenario: VirtualScenario) -> Union[str, None]:
-        skip_reason = self._get_scenario_attr(scenario, "__vedro__skip_reason__", None)
-        return cast(Union[str, None], skip_reason)
+        if not self._deselected_by_path:
+            return False
+        return self._is_scenario_indexed(self._deselected_by_path, scenario, scenario_path)
 
     async def on_startup(self, event: StartupEvent) -> None:
-        special_scenarios = set()
+        has_special = False
+        # Selected scenarios without @vedro.only, ignored afterwards if any special ones exist
+        regular_scenarios: List[VirtualScenario] = []
+        ignored_scenarios: List[VirtualScenario] = []
 
         scheduler = event.scheduler
         async for scenario in scheduler:
             if self._is_scenario_ignored(scenario):
-                scheduler.ignore(scenario)
+                ignored_scenarios.append(scenario)
             else:
-                if self._is_scenario_skipped(scenario):
-                    scenario.skip(reason=self._get_skip_reason(scenario))
-                if self._is_scenario_special(scenario):
+                is_skipped, is_special, skip_reason = self._resolve_scenario_meta(scenario)
+                if is_skipped:
+                    scenario.skip(reason=skip_reason)
+                if is_special:
                     if self._forbid_only:
                         raise ValueError(f"Scenario '{scenario.unique_id}' has @vedro.only, but "
                                          "'forbid_only' option is enabled")
-                    special_scenarios.add(scenario.unique_id)
+                    has_special = True
+                else:
+                    regular_scenarios.append(scenario)
+
+        if has_special:
+            ignored_scenarios.extend(regular_scenarios)
 
-        if len(special_scenarios) > 0:
-            async for scenario in scheduler:
-                if scenario.unique_id not in special_scenarios:
-                    scheduler.ignore(scenario)
+        scheduler.ignore_many(ignored_scenarios)
 
 
 class Skipper(PluginConfig):